@@ -522,14 +522,8 @@ void SFCPackTuner::getSortedOrder2D()
             }
         }
 
-    // sort the tuples
-    sort(m_particle_bins.begin(), m_particle_bins.begin() + m_pdata->getN());
-
-    // translate the sorted order
-    for (unsigned int j = 0; j < m_pdata->getN(); j++)
-        {
-        m_sort_order[j] = m_particle_bins[j].second;
-        }
+    // sort the tuples and translate the sorted order
+    sortParticleBins(m_grid * m_grid);
     }
 
 void SFCPackTuner::getSortedOrder3D()
@@ -633,13 +627,50 @@ void SFCPackTuner::getSortedOrder3D()
         m_particle_bins[n] = std::pair<unsigned int, unsigned int>(h_traversal_order.data[bin], n);
         }
 
-    // sort the tuples
-    sort(m_particle_bins.begin(), m_particle_bins.begin() + m_pdata->getN());
+    // sort the tuples and translate the sorted order
+    sortParticleBins(m_grid * m_grid * m_grid);
+    }
+
+/*! \param nbins Number of bins particles were assigned to
+
+    Sorts m_particle_bins by bin index with a stable least-significant-digit
+    radix sort and fills m_sort_order with the resulting particle order. The
+    radix sort runs in O(N) time with small fixed-size bucket counters,
+    replacing the O(N log N) comparison sort previously used here. Stability
+    preserves the original particle order within each bin, producing the same
+    order as a lexicographic sort of the (bin, index) tuples.
+*/
+void SFCPackTuner::sortParticleBins(unsigned int nbins)
+    {
+    const unsigned int N = m_pdata->getN();
+
+    m_particle_bins_alt.resize(m_particle_bins.size());
+
+    std::vector<std::pair<unsigned int, unsigned int>>* src = &m_particle_bins;
+    std::vector<std::pair<unsigned int, unsigned int>>* dst = &m_particle_bins_alt;
+
+    // process 8 bits per pass, with only as many passes as the key range needs
+    // (the shift < 32 bound also keeps the shift count defined for nbins > 2^24)
+    for (unsigned int shift = 0; shift < 32 && ((nbins - 1) >> shift); shift += 8)
+        {
+        unsigned int counts[257] = {0};
+
+        for (unsigned int n = 0; n < N; n++)
+            counts[(((*src)[n].first >> shift) & 0xff) + 1]++;
+
+        for (unsigned int b = 1; b <= 256; b++)
+            counts[b] += counts[b - 1];
+
+        for (unsigned int n = 0; n < N; n++)
+            (*dst)[counts[((*src)[n].first >> shift) & 0xff]++] = (*src)[n];
+
+        std::swap(src, dst);
+        }
 
     // translate the sorted order
-    for (unsigned int j = 0; j < m_pdata->getN(); j++)
+    for (unsigned int j = 0; j < N; j++)
         {
-        m_sort_order[j] = m_particle_bins[j].second;
+        m_sort_order[j] = (*src)[j].second;
         }
     }
 
@@ -91,6 +91,9 @@ class PYBIND11_EXPORT SFCPackTuner : public Tuner
     //! Helper function that actually performs the sort
     virtual void getSortedOrder3D();
 
+    //! Sort the binned particles and fill m_sort_order
+    void sortParticleBins(unsigned int nbins);
+
     //! Apply the sorted order to the particle data
     virtual void applySortOrder();
 
@@ -113,6 +116,8 @@ class PYBIND11_EXPORT SFCPackTuner : public Tuner
     private:
     std::vector<unsigned int> m_sort_order; //!< Generated sort order of the particles
     std::vector<std::pair<unsigned int, unsigned int>> m_particle_bins; //!< Binned particles
+    std::vector<std::pair<unsigned int, unsigned int>>
+        m_particle_bins_alt; //!< Scratch space for the radix sort
     std::shared_ptr<Trigger> m_trigger;
     };
 
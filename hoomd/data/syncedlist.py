@@ -16,6 +16,8 @@ class _PartialIsInstance:
     functools.partial since we need to partially apply the second argument.
     """
 
+    __slots__ = ('classes',)
+
     def __init__(self, classes):
         self.classes = classes
 
@@ -30,6 +32,8 @@ class _PartialGetAttr:
     functools.partial since we need to partially apply the second argument.
     """
 
+    __slots__ = ('attr',)
+
     def __init__(self, attr):
         self.attr = attr
 
@@ -45,6 +49,8 @@ def identity(obj):
 class _SimulationPlaceHolder:
     """Used to ensure objects are not added to two locations at once."""
 
+    __slots__ = ('_id',)
+
     def __init__(self, obj):
         self._id = id(obj)
 
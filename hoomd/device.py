@@ -198,6 +198,9 @@ class GPU(Device):
 
     """
 
+    # suffix appended to C++ class names when resolving device variants
+    _cpp_cls_suffix = 'GPU'
+
     def __init__(self,
                  gpu_ids=None,
                  num_cpu_threads=None,
@@ -326,6 +329,9 @@ class CPU(Device):
     In MPI execution environments, create a `CPU` device on every rank.
     """
 
+    # suffix appended to C++ class names when resolving device variants
+    _cpp_cls_suffix = ''
+
     def __init__(self,
                  num_cpu_threads=None,
                  communicator=None,
@@ -141,7 +141,7 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
     const detail::AABBTree& aabb_tree = this->m_mc->buildAABBTree();
 
     // update the image list
-    std::vector<vec3<Scalar>> image_list = this->m_mc->updateImageList();
+    const std::vector<vec3<Scalar>>& image_list = this->m_mc->updateImageList();
 
     uint16_t seed = m_sysdef->getSeed();
 
@@ -177,6 +177,11 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
         n_sample /= this->m_exec_conf->getNRanks();
 #endif
 
+        // hoist quantities that are invariant over the sample loop
+        const typename Shape::param_type& params_i = params[m_type];
+        const unsigned int n_images = (unsigned int)image_list.size();
+        const unsigned int n_nodes = aabb_tree.getNumNodes();
+
         for (unsigned int i = 0; i < n_sample; i++)
             {
             // select a random particle coordinate in the box
@@ -191,7 +196,7 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
             Scalar3 f = make_scalar3(xrand, yrand, zrand);
             vec3<Scalar> pos_i = vec3<Scalar>(box.makeCoordinates(f));
 
-            Shape shape_i(quat<Scalar>(), params[m_type]);
+            Shape shape_i(quat<Scalar>(), params_i);
             if (shape_i.hasOrientation())
                 {
                 shape_i.orientation = generateRandomOrientation(rng_i, ndim);
@@ -202,7 +207,6 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
             detail::AABB aabb_i_local = shape_i.getAABB(vec3<Scalar>(0, 0, 0));
 
             // All image boxes (including the primary)
-            const unsigned int n_images = (unsigned int)image_list.size();
             for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
                 {
                 vec3<Scalar> pos_i_image = pos_i + image_list[cur_image];
@@ -210,8 +214,7 @@ template<class Shape> void ComputeFreeVolume<Shape>::computeFreeVolume(uint64_t
                 aabb.translate(pos_i_image);
 
                 // stackless search
-                for (unsigned int cur_node_idx = 0; cur_node_idx < aabb_tree.getNumNodes();
-                     cur_node_idx++)
+                for (unsigned int cur_node_idx = 0; cur_node_idx < n_nodes; cur_node_idx++)
                     {
                     if (detail::overlap(aabb_tree.getNodeAABB(cur_node_idx), aabb))
                         {
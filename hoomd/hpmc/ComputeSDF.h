@@ -176,7 +176,8 @@ template<class Shape> class ComputeSDF : public Compute
                       const quat<Scalar>& orientation_i,
                       const quat<Scalar>& orientation_j,
                       const typename Shape::param_type& params_i,
-                      const typename Shape::param_type& params_j);
+                      const typename Shape::param_type& params_j,
+                      size_t max_bin);
 
     //! Return the sdf
     virtual void computeSDF(uint64_t timestep);
@@ -316,7 +317,8 @@ template<class Shape> void ComputeSDF<Shape>::countHistogram(uint64_t timestep)
         // read in the current position and orientation
         Scalar4 postype_i = h_postype.data[i];
         Scalar4 orientation_i = h_orientation.data[i];
-        Shape shape_i(quat<Scalar>(orientation_i), params[__scalar_as_int(postype_i.w)]);
+        const param_type& params_i = params[__scalar_as_int(postype_i.w)];
+        Shape shape_i(quat<Scalar>(orientation_i), params_i);
         vec3<Scalar> pos_i = vec3<Scalar>(postype_i);
 
         // construct the AABB around the particle's circumsphere
@@ -359,8 +361,9 @@ template<class Shape> void ComputeSDF<Shape>::countHistogram(uint64_t timestep)
                             size_t bin = computeBin(r_ij,
                                                     quat<Scalar>(orientation_i),
                                                     quat<Scalar>(orientation_j),
-                                                    params[__scalar_as_int(postype_i.w)],
-                                                    params[__scalar_as_int(postype_j.w)]);
+                                                    params_i,
+                                                    params[__scalar_as_int(postype_j.w)],
+                                                    min_bin);
 
                             if (bin >= 0)
                                 min_bin = std::min(min_bin, bin);
@@ -388,6 +391,8 @@ template<class Shape> void ComputeSDF<Shape>::countHistogram(uint64_t timestep)
     \param params_i Parameters for particle i
     \param params_j Parameters for particle j
 
+    \param max_bin Upper bound on bins of interest (exclusive)
+
     \returns s bin index
 
     In the first general version, computeBin uses a binary search tree to determine
@@ -396,16 +401,22 @@ template<class Shape> void ComputeSDF<Shape>::countHistogram(uint64_t timestep)
     left boundary and does overlap a the right. Then it picks a new point halfway between
     the left and right, ensuring that the same assumption holds. Once right=left+1, the
     correct bin has been found.
+
+    Only the minimum bin over all neighbors of a particle is histogrammed, so callers
+    pass the running minimum as \a max_bin. Pairs that do not overlap at that scale
+    cannot lower the minimum and are rejected with a single overlap test instead of
+    a full binary search.
 */
 template<class Shape>
 size_t ComputeSDF<Shape>::computeBin(const vec3<Scalar>& r_ij,
                                      const quat<Scalar>& orientation_i,
                                      const quat<Scalar>& orientation_j,
                                      const typename Shape::param_type& params_i,
-                                     const typename Shape::param_type& params_j)
+                                     const typename Shape::param_type& params_j,
+                                     size_t max_bin)
     {
     size_t L = 0;
-    size_t R = m_hist.size();
+    size_t R = std::min(max_bin, m_hist.size());
 
     // if the particles already overlap a the left boundary, return an out of range value
     if (detail::test_scaled_overlap<Shape>(r_ij,
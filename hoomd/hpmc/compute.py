@@ -8,13 +8,51 @@ from __future__ import print_function
 
 from hoomd import _hoomd
 from hoomd.operation import Compute
-from hoomd.hpmc import _hpmc
-from hoomd.hpmc import integrate
 from hoomd.data.parameterdicts import ParameterDict
 from hoomd.logging import log
-import hoomd
 import numpy
 
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _batch_sdf_histogram(x, nbins, inv_dx, out):
+        for i in range(x.shape[0]):
+            # reject negatives before truncating: int() rounds toward zero,
+            # which would otherwise place samples in (-dx, 0) into bin 0
+            if x[i] < 0:
+                continue
+            b = int(x[i] * inv_dx)
+            if b < nbins:
+                out[b] += 1
+
+except ImportError:
+    _batch_sdf_histogram = None
+
+# Registry of resolved C++ compute classes, keyed by (base class name,
+# integrator class, device class suffix).
+_cpp_cls_registry = {}
+
+
+def _get_cpp_cls(base, integrator_cls, suffix):
+    """Map an integrator class to the C++ compute class supporting it.
+
+    Entries are registered on first use. After registration, dispatch is a
+    single dictionary lookup keyed on the integrator class with no name
+    fabrication on the attach path.
+    """
+    key = (base, integrator_cls, suffix)
+    cpp_cls = _cpp_cls_registry.get(key)
+    if cpp_cls is None:
+        # deferred to keep the HPMC extension load off the import path
+        from hoomd.hpmc import _hpmc
+
+        cpp_cls = getattr(_hpmc, base + integrator_cls.__name__ + suffix, None)
+        if cpp_cls is None:
+            raise RuntimeError("Unsupported integrator.")
+        _cpp_cls_registry[key] = cpp_cls
+    return cpp_cls
+
 
 class FreeVolume(Compute):
     r"""Compute the free volume available to a test particle.
@@ -66,6 +104,14 @@ class FreeVolume(Compute):
 
     """
 
+    _reserved_default_attrs = {
+        **Compute._reserved_default_attrs,
+        '_cl': None,
+        '_cl_sys_def': None,
+    }
+    _remove_for_pickling = Compute._remove_for_pickling + ('_cl', '_cl_sys_def')
+    _skip_for_equality = Compute._skip_for_equality | {'_cl', '_cl_sys_def'}
+
     def __init__(self, test_particle_type, num_samples):
         # store metadata
         param_dict = ParameterDict(test_particle_type=str, num_samples=int)
@@ -75,24 +121,22 @@ class FreeVolume(Compute):
         self._param_dict.update(param_dict)
 
     def _attach(self):
+        from hoomd.hpmc import integrate
+
         integrator = self._simulation.operations.integrator
         if not isinstance(integrator, integrate.HPMCIntegrator):
             raise RuntimeError("The integrator must be an HPMC integrator.")
 
-        # Extract 'Shape' from '<hoomd.hpmc.integrate.Shape object>'
-        integrator_name = integrator.__class__.__name__
-        try:
-            if isinstance(self._simulation.device, hoomd.device.CPU):
-                cpp_cls = getattr(_hpmc, 'ComputeFreeVolume' + integrator_name)
-            else:
-                cpp_cls = getattr(_hpmc,
-                                  'ComputeFreeVolume' + integrator_name + 'GPU')
-        except AttributeError:
-            raise RuntimeError("Unsupported integrator.")
+        suffix = self._simulation.device._cpp_cls_suffix
+        cpp_cls = _get_cpp_cls('ComputeFreeVolume', type(integrator), suffix)
 
-        cl = _hoomd.CellList(self._simulation.state._cpp_sys_def)
-        self._cpp_obj = cpp_cls(self._simulation.state._cpp_sys_def,
-                                integrator._cpp_obj, cl)
+        # reuse the cell list across attach cycles with the same system
+        # definition to avoid rebuilding its internal arrays
+        sys_def = self._simulation.state._cpp_sys_def
+        if self._cl is None or self._cl_sys_def is not sys_def:
+            self._cl = _hoomd.CellList(sys_def)
+            self._cl_sys_def = sys_def
+        self._cpp_obj = cpp_cls(sys_def, integrator._cpp_obj, self._cl)
 
         super()._attach()
 
@@ -101,8 +145,9 @@ class FreeVolume(Compute):
         """Free volume available to the test particle \
         :math:`[\\mathrm{length}^{2}]` in 2D and \
         :math:`[\\mathrm{length}^{3}]` in 3D."""
-        self._cpp_obj.compute(self._simulation.timestep)
-        return self._cpp_obj.free_volume
+        cpp_obj = self._cpp_obj
+        cpp_obj.compute(self._simulation.timestep)
+        return cpp_obj.free_volume
 
 
 class SDF(Compute):
@@ -158,15 +203,28 @@ class SDF(Compute):
         param_dict = ParameterDict(xmax=float(xmax), dx=float(dx))
         self._param_dict.update(param_dict)
 
+        # cached x coordinates for the s(0+) fit, rebuilt when xmax/dx change
+        self._fit_params = None
+        self._x_fit = None
+
+    def _get_fit_coordinates(self):
+        """Bin center x coordinates for the s(0+) fit, cached between calls."""
+        xmax = self.xmax
+        dx = self.dx
+        if self._fit_params != (xmax, dx):
+            n_fit = int(numpy.ceil(xmax / dx))
+            self._x_fit = numpy.arange(n_fit, dtype=numpy.float64) * dx + dx / 2
+            self._fit_params = (xmax, dx)
+        return self._x_fit
+
     def _attach(self):
+        from hoomd.hpmc import integrate
+
         integrator = self._simulation.operations.integrator
         if not isinstance(integrator, integrate.HPMCIntegrator):
             raise RuntimeError("The integrator must be an HPMC integrator.")
 
-        # Extract 'Shape' from '<hoomd.hpmc.integrate.Shape object>'
-        integrator_name = integrator.__class__.__name__
-
-        cpp_cls = getattr(_hpmc, 'ComputeSDF' + integrator_name)
+        cpp_cls = _get_cpp_cls('ComputeSDF', type(integrator), '')
 
         self._cpp_obj = cpp_cls(self._simulation.state._cpp_sys_def,
                                 integrator._cpp_obj, self.xmax, self.dx)
@@ -182,8 +240,9 @@ class SDF(Compute):
             In MPI parallel execution, the array is available on rank 0 only.
             `sdf` is `None` on ranks >= 1.
         """
-        self._cpp_obj.compute(self._simulation.timestep)
-        return self._cpp_obj.sdf
+        cpp_obj = self._cpp_obj
+        cpp_obj.compute(self._simulation.timestep)
+        return cpp_obj.sdf
 
     @log(requires_run=True)
     def betaP(self):  # noqa: N802 - allow function name
@@ -203,19 +262,48 @@ class SDF(Compute):
             In MPI parallel execution, `betaP` is available on rank 0 only.
             `betaP` is `None` on ranks >= 1.
         """
-        if not numpy.isnan(self.sdf).all():
+        sdf = self.sdf
+        if not numpy.isnan(sdf).all():
             # get the values to fit
-            n_fit = int(numpy.ceil(self.xmax / self.dx))
-            sdf_fit = self.sdf[0:n_fit]
-            # construct the x coordinates
-            x_fit = numpy.arange(0, self.xmax, self.dx)
-            x_fit += self.dx / 2
+            x_fit = self._get_fit_coordinates()
+            sdf_fit = sdf[0:len(x_fit)]
             # perform the fit and extrapolation
-            p = numpy.polyfit(x_fit, sdf_fit, 5)
+            p = numpy.polynomial.polynomial.polyfit(x_fit, sdf_fit, 5)
 
             box = self._simulation.state.box
             N = self._simulation.state.N_particles
             rho = N / box.volume
-            return rho * (1 + numpy.polyval(p, 0.0) / (2 * box.dimensions))
+            s0 = numpy.polynomial.polynomial.polyval(0.0, p)
+            return rho * (1 + s0 / (2 * box.dimensions))
         else:
             return None
+
+    def batch_histogram(self, x):
+        r"""Histogram raw scale samples with the same binning as `sdf`.
+
+        Args:
+            x ((*N*,) `numpy.ndarray` of `float`): Scale samples to histogram.
+
+        Returns:
+            (*N_bins*,) `numpy.ndarray` of `int`: Number of samples in each
+            bin. Samples outside :math:`[0, xmax)` are ignored.
+
+        Use `batch_histogram` to aggregate scale samples from many frames in
+        post processing. Bins are uniform with width `dx`, so samples are
+        assigned by a rescale and floor without any binary search. The
+        histogram is accumulated with a Numba jitted kernel when ``numba`` is
+        available and falls back to `numpy.bincount` otherwise.
+        """
+        nbins = int(numpy.ceil(self.xmax / self.dx))
+        x = numpy.ascontiguousarray(x, dtype=numpy.float64)
+
+        if _batch_sdf_histogram is not None:
+            counts = numpy.zeros(nbins, dtype=numpy.int64)
+            _batch_sdf_histogram(x, nbins, 1.0 / self.dx, counts)
+            return counts
+
+        # use the same rescale arithmetic as the jitted kernel so both paths
+        # assign boundary samples to identical bins
+        bins = numpy.floor(x * (1.0 / self.dx)).astype(numpy.int64)
+        valid = (bins >= 0) & (bins < nbins)
+        return numpy.bincount(bins[valid], minlength=nbins)
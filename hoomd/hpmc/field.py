@@ -191,7 +191,7 @@ class lattice_field(_external):
               run(1000)
 
         """
-        if timestep == None:
+        if timestep is None:
             timestep = hoomd.context.current.system.getCurrentTimeStep()
         self.cpp_compute.reset(timestep)
 
@@ -26,6 +26,43 @@ def test_before_attaching():
         sdf.betaP
 
 
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_batch_histogram(use_numba, monkeypatch):
+    from hoomd.hpmc import compute
+
+    if use_numba and compute._batch_sdf_histogram is None:
+        pytest.skip("numba is not available")
+    if not use_numba:
+        monkeypatch.setattr(compute, '_batch_sdf_histogram', None)
+
+    xmax = 0.02
+    dx = 1e-4
+    sdf = hoomd.hpmc.compute.SDF(xmax=xmax, dx=dx)
+    nbins = int(np.ceil(xmax / dx))
+
+    # bin center samples land in the expected bins
+    x = np.array([dx / 2, dx / 2, 3 * dx / 2, xmax - dx / 2])
+    counts = sdf.batch_histogram(x)
+    assert counts.shape == (nbins,)
+    assert counts[0] == 2
+    assert counts[1] == 1
+    assert counts[nbins - 1] == 1
+    assert counts.sum() == 4
+
+    # samples outside [0, xmax) are ignored, including those in (-dx, 0)
+    x = np.array([-dx / 2, -dx, xmax + dx, 5.0, -3.0])
+    assert sdf.batch_histogram(x).sum() == 0
+
+    # matches numpy.histogram on uniform bins for random samples
+    rng = np.random.default_rng(42)
+    x = rng.uniform(-0.005, 0.03, 10000)
+    counts = sdf.batch_histogram(x)
+    ref, _ = np.histogram(x[(x >= 0) & (x < nbins * dx)],
+                          bins=nbins,
+                          range=(0, nbins * dx))
+    assert (counts == ref).all()
+
+
 def test_after_attaching(valid_args, simulation_factory,
                          lattice_snapshot_factory):
     integrator, args, n_dimensions = valid_args
@@ -445,6 +445,10 @@ class _LoggerEntry:
         self.obj = obj
         self.attr = attr
         self.category = category
+        # precompute per-access metadata: enum attribute access goes through a
+        # descriptor and would otherwise run on every logged value
+        self._is_state = category is LoggerCategories.state
+        self._category_name = category.name
 
     @classmethod
     def from_logger_quantity(cls, obj, logger_quantity):
@@ -490,12 +494,12 @@ class _LoggerEntry:
         except DataAccessError:
             attr = None
 
-        if self.category is LoggerCategories.state:
+        if self._is_state:
             return attr
         if callable(attr):
-            return (attr(), self.category.name)
+            return (attr(), self._category_name)
         else:
-            return (attr, self.category.name)
+            return (attr, self._category_name)
 
     def __eq__(self, other):
         return (self.obj == other.obj and self.attr == other.attr
@@ -108,10 +108,10 @@ void ZeroMomentumUpdater::update(uint64_t timestep)
             {
             if (h_body.data[i] >= MIN_FLOPPY || h_body.data[i] == h_tag.data[i])
                 {
-                Scalar mass = h_vel.data[i].w;
-                h_vel.data[i].x -= avg_px / mass;
-                h_vel.data[i].y -= avg_py / mass;
-                h_vel.data[i].z -= avg_pz / mass;
+                Scalar minv = Scalar(1.0) / h_vel.data[i].w;
+                h_vel.data[i].x -= avg_px * minv;
+                h_vel.data[i].y -= avg_py * minv;
+                h_vel.data[i].z -= avg_pz * minv;
                 }
             }
         } // end GPUArray scope
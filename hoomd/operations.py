@@ -195,9 +195,10 @@ class Operations(Collection):
         if not self._sys_init:
             raise RuntimeError("System not initialized yet")
         sim = self._simulation
-        if not (self.integrator is None or self.integrator._attached):
-            self._integrator._add(self._simulation)
-            self.integrator._attach()
+        integrator = self._integrator
+        if not (integrator is None or integrator._attached):
+            integrator._add(sim)
+            integrator._attach()
         if not self.updaters._synced:
             self.updaters._sync(sim, sim._cpp_sys.updaters)
         if not self.writers._synced:
@@ -210,7 +211,7 @@ class Operations(Collection):
 
     def _unschedule(self):
         """Undo the effects of `Operations._schedule`."""
-        if self.integrator is not None:
+        if self._integrator is not None:
             self._integrator._detach()
         self._writers._unsync()
         self._updaters._unsync()
@@ -229,13 +230,15 @@ class Operations(Collection):
 
     def __iter__(self):
         """Iterates through all contained operations."""
-        integrator = (self._integrator,) if self._integrator else []
+        integrator = (self._integrator,) if self._integrator is not None else []
         yield from chain(self._tuners, self._updaters, integrator,
                          self._writers, self._computes)
 
     def __len__(self):
         """Return the number of operations contained in this collection."""
-        return len(list(self))
+        base = len(self._tuners) + len(self._updaters) + len(self._writers) \
+            + len(self._computes)
+        return base + 1 if self._integrator is not None else base
 
     @property
     def integrator(self):